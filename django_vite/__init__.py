@@ -0,0 +1,5 @@
+import django
+
+# Django >= 3.2 finds the application configuration automatically.
+if django.VERSION < (3, 2):
+    default_app_config = "django_vite.apps.DjangoViteConfig"
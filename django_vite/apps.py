@@ -0,0 +1,37 @@
+import warnings
+
+from django.apps import AppConfig
+
+
+class DjangoViteConfig(AppConfig):
+    """
+    Django Vite application configuration.
+    """
+
+    name = "django_vite"
+    verbose_name = "Django Vite"
+
+    def ready(self) -> None:
+        """
+        Loads the Vite manifest when Django starts instead of
+        during the first request using a Vite template tag.
+        Errors in the manifest are also raised at startup.
+
+        A missing manifest file (e.g. before running 'collectstatic')
+        only emits a warning, so management commands still work, and
+        the manifest is loaded on first use of a Vite template tag.
+        """
+
+        try:
+            from .templatetags.django_vite import DjangoViteAssetLoader
+
+            DjangoViteAssetLoader.instance()
+        except RuntimeError as error:
+            if not isinstance(error.__cause__, FileNotFoundError):
+                raise
+
+            warnings.warn(
+                f"{error}. It will be loaded on first use of a Vite "
+                f"template tag.",
+                RuntimeWarning,
+            )
@@ -0,0 +1,80 @@
+import importlib.util
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Compiles the Vite manifest into a Python module, loaded at startup "
+        "instead of parsing and resolving the JSON manifest file."
+    )
+
+    def handle(self, *args, **options) -> None:
+        # Imported here so the template tags module, reading the settings,
+        # is only imported when the command runs.
+        from django_vite.templatetags.django_vite import (
+            DJANGO_VITE_COMPILED_MANIFEST_PATH,
+            DJANGO_VITE_MANIFEST_PATH,
+            DJANGO_VITE_STATIC_URL,
+            _create_loader,
+        )
+
+        if DJANGO_VITE_COMPILED_MANIFEST_PATH is None:
+            raise CommandError(
+                "Set DJANGO_VITE_COMPILED_MANIFEST_PATH in your settings "
+                "to compile the Vite manifest."
+            )
+
+        try:
+            manifest_mtime_ns = os.stat(DJANGO_VITE_MANIFEST_PATH).st_mtime_ns
+        except OSError as error:
+            raise CommandError(
+                f"Cannot read Vite manifest file at "
+                f"{DJANGO_VITE_MANIFEST_PATH} : {str(error)}"
+            )
+
+        # The manifest file is always read again, and the loader used by
+        # template tags is left untouched.
+        loader = _create_loader()
+
+        try:
+            loader._read_manifest_file()
+        except RuntimeError as error:
+            raise CommandError(str(error))
+
+        try:
+            with open(
+                DJANGO_VITE_COMPILED_MANIFEST_PATH, "w", encoding="utf-8"
+            ) as compiled_manifest_file:
+                # SafeString tags are written as plain strings,
+                # they are marked safe again when loaded.
+                compiled_manifest_file.write(
+                    '# Generated by "python manage.py compile_vite_manifest", '
+                    "do not edit.\n"
+                    f"MANIFEST_PATH = {DJANGO_VITE_MANIFEST_PATH!r}\n"
+                    f"MANIFEST_MTIME_NS = {manifest_mtime_ns!r}\n"
+                    f"STATIC_URL = {DJANGO_VITE_STATIC_URL!r}\n"
+                    f"MANIFEST = {loader._manifest!r}\n"
+                    f"RESOLVED = {loader._resolved!r}\n"
+                )
+
+            # Bytecode cached from a previous compilation in the same
+            # second with the same size would be considered up to date.
+            bytecode_path = importlib.util.cache_from_source(
+                DJANGO_VITE_COMPILED_MANIFEST_PATH
+            )
+            if os.path.exists(bytecode_path):
+                os.remove(bytecode_path)
+        except OSError as error:
+            raise CommandError(
+                f"Cannot write compiled Vite manifest at "
+                f"{DJANGO_VITE_COMPILED_MANIFEST_PATH} : {str(error)}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Vite manifest compiled to "
+                f"{DJANGO_VITE_COMPILED_MANIFEST_PATH}"
+            )
+        )
@@ -1,11 +1,15 @@
+import functools
+import importlib.util
 import json
+import os
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Tuple
 from urllib.parse import urljoin
 
 from django import template
 from django.conf import settings
-from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeString
 
 register = template.Library()
 
@@ -44,7 +48,8 @@ DJANGO_VITE_STATIC_URL_PREFIX = getattr(
     settings, "DJANGO_VITE_STATIC_URL_PREFIX", ""
 )
 
-DJANGO_VITE_STATIC_ROOT = (
+# Paths used at runtime are stored as plain strings.
+DJANGO_VITE_STATIC_ROOT = str(
     DJANGO_VITE_ASSETS_PATH
     if DJANGO_VITE_DEV_MODE
     else Path(settings.STATIC_ROOT) / DJANGO_VITE_STATIC_URL_PREFIX
@@ -52,11 +57,24 @@ DJANGO_VITE_STATIC_ROOT = (
 
 # Path to your manifest file generated by Vite.
 # Should by in "DJANGO_VITE_ASSETS_PATH".
-DJANGO_VITE_MANIFEST_PATH = getattr(
-    settings,
-    "DJANGO_VITE_MANIFEST_PATH",
-    DJANGO_VITE_STATIC_ROOT / "manifest.json",
+DJANGO_VITE_MANIFEST_PATH = str(
+    getattr(
+        settings,
+        "DJANGO_VITE_MANIFEST_PATH",
+        os.path.join(DJANGO_VITE_STATIC_ROOT, "manifest.json"),
+    )
+)
+
+# Path of the Python module written by the 'compile_vite_manifest' command,
+# loaded instead of the manifest file when up to date.
+# No module is written nor loaded if not set.
+DJANGO_VITE_COMPILED_MANIFEST_PATH = getattr(
+    settings, "DJANGO_VITE_COMPILED_MANIFEST_PATH", None
 )
+if DJANGO_VITE_COMPILED_MANIFEST_PATH is not None:
+    DJANGO_VITE_COMPILED_MANIFEST_PATH = str(
+        DJANGO_VITE_COMPILED_MANIFEST_PATH
+    )
 
 # Motif in the 'manifest.json' to find the polyfills generated by Vite.
 DJANGO_VITE_LEGACY_POLYFILLS_MOTIF = getattr(
@@ -68,17 +86,70 @@ DJANGO_VITE_STATIC_URL = urljoin(
 )
 
 # Make sure 'DJANGO_VITE_STATIC_URL' finish with a '/'
-if DJANGO_VITE_STATIC_URL[-1] != "/":
+if not DJANGO_VITE_STATIC_URL.endswith("/"):
     DJANGO_VITE_STATIC_URL += "/"
 
+# Maximum number of generated outputs kept in memory for each template tag.
+DJANGO_VITE_TAG_CACHE_SIZE = getattr(
+    settings, "DJANGO_VITE_TAG_CACHE_SIZE", 1024
+)
+
+# Base URL of assets served by the Vite development server.
+_DEV_SERVER_STATIC_URL = urljoin(
+    f"{DJANGO_VITE_DEV_SERVER_PROTOCOL}://"
+    f"{DJANGO_VITE_DEV_SERVER_HOST}:{DJANGO_VITE_DEV_SERVER_PORT}",
+    DJANGO_VITE_STATIC_URL,
+)
+
+# Attributes of the generated tags when no custom attributes are given.
+_SCRIPT_MODULE_ATTRS = {"type": "module", "crossorigin": ""}
+_SCRIPT_MODULE_ATTRS_STR = 'type="module" crossorigin=""'
+_SCRIPT_NOMODULE_ATTRS = {"nomodule": "", "crossorigin": ""}
+_SCRIPT_NOMODULE_ATTRS_STR = 'nomodule="" crossorigin=""'
+_SCRIPT_DEV_ATTRS_STR = 'type="module"'
+_PRELOAD_ATTRS_STR = (
+    'type="text/javascript" crossorigin="anonymous" '
+    'rel="modulepreload" as="script"'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_production_server_url(path: str) -> str:
+    """
+    Generates an URL to an asset served in production
+    (as Django static files).
+    Shared chunks and CSS files are only resolved once.
+
+    Arguments:
+        path {str} -- Path to the asset, relative to the static URL.
+
+    Returns:
+        str -- Full URL to the asset.
+    """
+
+    return urljoin(DJANGO_VITE_STATIC_URL, path)
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_vite_server_url(path: str) -> str:
+    """
+    Generates an URL to and asset served by the Vite development server.
+
+    Keyword Arguments:
+        path {str} -- Path to the asset.
+
+    Returns:
+        str -- Full URL to the asset.
+    """
+
+    return urljoin(_DEV_SERVER_STATIC_URL, path)
+
 
 class DjangoViteAssetLoader:
     """
     Class handling Vite asset loading.
     """
 
-    _instance = None
-
     def __init__(self) -> None:
         raise RuntimeError("Use the instance() method instead.")
 
@@ -112,11 +183,97 @@ class DjangoViteAssetLoader:
                 this asset in your page.
         """
 
-        if DJANGO_VITE_DEV_MODE:
-            return DjangoViteAssetLoader._generate_script_tag(
-                DjangoViteAssetLoader._generate_vite_server_url(path),
-                {"type": "module"},
-            )
+        tags, import_preload_tags = self._generate_vite_asset_tags(
+            path,
+            DjangoViteAssetLoader._generate_script_attrs_str(
+                _SCRIPT_MODULE_ATTRS, _SCRIPT_MODULE_ATTRS_STR, kwargs
+            ),
+        )
+
+        return SafeString("\n".join((tags, *import_preload_tags)))
+
+    def generate_vite_assets(
+        self,
+        *paths: str,
+        **kwargs: Dict[str, str],
+    ) -> str:
+        """
+        Generates the tags of 'generate_vite_asset' for several JS/TS
+        assets, chunks imported by several of them being preloaded once.
+
+        Arguments:
+            *paths {str} -- Paths to Vite JS/TS assets to include.
+
+        Keyword Arguments:
+            **kwargs {Dict[str, str]} -- Adds new attributes to generated
+                script tags.
+
+        Raises:
+            RuntimeError: If cannot find a file path in the
+                manifest (only in production).
+
+        Returns:
+            str -- The <script> tags and all <link> tags to import
+                these assets in your page.
+        """
+
+        scripts_attrs_str = DjangoViteAssetLoader._generate_script_attrs_str(
+            _SCRIPT_MODULE_ATTRS, _SCRIPT_MODULE_ATTRS_STR, kwargs
+        )
+
+        return DjangoViteAssetLoader._join_assets_tags(
+            self._generate_vite_asset_tags(path, scripts_attrs_str)
+            for path in paths
+        )
+
+    def _dev_generate_vite_asset_tags(
+        self,
+        path: str,
+        scripts_attrs_str: str,
+    ) -> Tuple[SafeString, List[str]]:
+        """
+        Development implementation of '_generate_vite_asset_tags',
+        custom attributes are ignored as Vite loads all by itself.
+
+        Arguments:
+            path {str} -- Path to a Vite JS/TS asset to include.
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Returns:
+            tuple -- The <script> tag and no preload tags.
+        """
+
+        return (
+            DjangoViteAssetLoader._generate_script_tag(
+                _generate_vite_server_url(path),
+                _SCRIPT_DEV_ATTRS_STR,
+            ),
+            [],
+        )
+
+    def _prod_generate_vite_asset_tags(
+        self,
+        path: str,
+        scripts_attrs_str: str,
+    ) -> Tuple[SafeString, List[str]]:
+        """
+        Generates tags of 'generate_vite_asset', keeping the preload tags
+        of imported chunks apart so they can be deduplicated in a page.
+
+        Arguments:
+            path {str} -- Path to a Vite JS/TS asset to include.
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Raises:
+            RuntimeError: If cannot find the file path in the
+                manifest.
+
+        Returns:
+            tuple -- The <link> tags of CSS dependencies followed by the
+                <script> tag, and the list of preload tags of imports.
+        """
 
         if not self._manifest or path not in self._manifest:
             raise RuntimeError(
@@ -124,62 +281,201 @@ class DjangoViteAssetLoader:
                 f"at {DJANGO_VITE_MANIFEST_PATH}"
             )
 
-        tags = []
-        manifest_entry = self._manifest[path]
-        scripts_attrs = {"type": "module", "crossorigin": "", **kwargs}
-
-        # Add dependent CSS
-        tags.extend(self._generate_css_files_of_asset(path, []))
-
-        # Add the script by itself
-        tags.append(
-            DjangoViteAssetLoader._generate_script_tag(
-                urljoin(DJANGO_VITE_STATIC_URL, manifest_entry["file"]),
-                attrs=scripts_attrs,
-            )
+        resolved_entry = self._resolved[path]
+        # Dependent CSS, then the script by itself, then its imports.
+        return (
+            SafeString(
+                "\n".join(
+                    (
+                        *resolved_entry["css_tags"],
+                        DjangoViteAssetLoader._generate_script_tag(
+                            resolved_entry["script_url"],
+                            scripts_attrs_str,
+                        ),
+                    )
+                )
+            ),
+            resolved_entry["import_preload_tags"],
         )
 
-        return "\n".join(tags)
-
     def _generate_css_files_of_asset(
-        self, path: str, already_processed: List[str]
+        self,
+        path: str,
+        tag_generator: Callable[[str], str],
     ) -> List[str]:
         """
         Generates all CSS tags for dependencies of an asset.
 
         Arguments:
             path {str} -- Path to an asset in the 'manifest.json'.
-            already_processed {list} -- List of already processed CSS file.
+            tag_generator {Callable[[str], str]} -- Generates the tag
+                of a CSS file from its URL.
 
         Returns:
             list -- List of CSS tags.
         """
 
-        tags = []
-        manifest_entry = self._manifest[path]
+        return [
+            tag_generator(url) for url in self._get_css_urls_of_asset(path)
+        ]
+
+    def _get_css_urls_of_asset(self, path: str) -> List[str]:
+        """
+        Gets URLs of all CSS dependencies of an asset, those of its imports
+        first, without duplicates.
+
+        Arguments:
+            path {str} -- Path to an asset in the 'manifest.json'.
+
+        Returns:
+            list -- List of CSS URLs.
+        """
+
+        self._walk_asset_imports(path)
+
+        return self._css_cache[path]
+
+    def _get_flat_imports_of_asset(self, path: str) -> List[str]:
+        """
+        Gets paths of all assets imported by an asset, directly or not,
+        each one after its own imports, without duplicates.
+
+        Arguments:
+            path {str} -- Path to an asset in the 'manifest.json'.
+
+        Returns:
+            list -- List of paths in the 'manifest.json'.
+        """
+
+        self._walk_asset_imports(path)
+
+        return self._flat_imports_cache[path]
+
+    def _walk_asset_imports(self, path: str) -> None:
+        """
+        Computes CSS URLs and flat imports of an asset and of all
+        the assets it imports.
+        Imports are walked iteratively in post-order and the results of
+        each visited asset are cached, so shared imports are only
+        walked once.
+        Assets importing each other (circular imports) all share the
+        results of the first one walked, as they import the same assets.
 
-        if "imports" in manifest_entry:
-            for import_path in manifest_entry["imports"]:
-                tags.extend(
-                    self._generate_css_files_of_asset(
-                        import_path, already_processed
+        Arguments:
+            path {str} -- Path to an asset in the 'manifest.json'.
+        """
+
+        stack = deque([(path, False)])
+        # Visit order and lowest visit order reachable of walked assets.
+        visit_order = {}
+        low_link = {}
+        # Walked assets whose circular imports are not resolved yet, with
+        # their partial results.
+        unresolved = []
+        partial_css_urls = {}
+        partial_flat_imports = {}
+
+        while stack:
+            current_path, imports_done = stack.pop()
+
+            if current_path in self._css_cache:
+                continue
+
+            manifest_entry = self._manifest[current_path]
+
+            if not imports_done:
+                # Already walked, or being walked for circular imports.
+                if current_path in visit_order:
+                    continue
+
+                visit_order[current_path] = low_link[current_path] = len(
+                    visit_order
+                )
+                unresolved.append(current_path)
+                stack.append((current_path, True))
+                stack.extend(
+                    (import_path, False)
+                    for import_path in reversed(
+                        manifest_entry.get("imports", [])
                     )
+                    if import_path not in self._css_cache
                 )
-
-        if "css" in manifest_entry:
-            for css_path in manifest_entry["css"]:
-                if css_path not in already_processed:
-                    tags.append(
-                        DjangoViteAssetLoader._generate_stylesheet_tag(
-                            urljoin(DJANGO_VITE_STATIC_URL, css_path)
-                        )
+                continue
+
+            css_urls = []
+            seen_css_urls = set()
+            flat_imports = []
+            seen_imports = {current_path}
+
+            for import_path in manifest_entry.get("imports", []):
+                # Imported asset with unresolved circular imports.
+                if import_path not in self._css_cache:
+                    low_link[current_path] = min(
+                        low_link[current_path], low_link[import_path]
                     )
 
-                already_processed.append(css_path)
+                for css_url in self._css_cache.get(
+                    import_path, partial_css_urls.get(import_path, [])
+                ):
+                    if css_url not in seen_css_urls:
+                        seen_css_urls.add(css_url)
+                        css_urls.append(css_url)
+
+                for flat_import_path in (
+                    *self._flat_imports_cache.get(
+                        import_path,
+                        partial_flat_imports.get(import_path, []),
+                    ),
+                    import_path,
+                ):
+                    if flat_import_path not in seen_imports:
+                        seen_imports.add(flat_import_path)
+                        flat_imports.append(flat_import_path)
+
+            for css_path in manifest_entry.get("css", []):
+                css_url = _generate_production_server_url(css_path)
+
+                if css_url not in seen_css_urls:
+                    seen_css_urls.add(css_url)
+                    css_urls.append(css_url)
+
+            if low_link[current_path] < visit_order[current_path]:
+                # Imports one of the assets being walked, results are
+                # completed once this one is done.
+                partial_css_urls[current_path] = css_urls
+                partial_flat_imports[current_path] = flat_imports
+                continue
+
+            while True:
+                resolved_path = unresolved.pop()
+                partial_css_urls.pop(resolved_path, None)
+                partial_flat_imports.pop(resolved_path, None)
+
+                self._css_cache[resolved_path] = css_urls
+                self._flat_imports_cache[resolved_path] = [
+                    flat_import_path
+                    for flat_import_path in (*flat_imports, current_path)
+                    if flat_import_path != resolved_path
+                ]
+
+                if resolved_path == current_path:
+                    break
+
+    def _dev_generate_vite_asset_url(self, path: str) -> str:
+        """
+        Development implementation of 'generate_vite_asset_url',
+        the asset is served by the Vite development server.
 
-        return tags
+        Arguments:
+            path {str} -- Path to a Vite asset.
 
-    def generate_vite_asset_url(self, path: str) -> str:
+        Returns:
+            str -- The URL of this asset.
+        """
+
+        return _generate_vite_server_url(path)
+
+    def _prod_generate_vite_asset_url(self, path: str) -> str:
         """
         Generates only the URL of an asset managed by ViteJS.
         Warning, this function does not generate URLs for dependant assets.
@@ -195,16 +491,13 @@ class DjangoViteAssetLoader:
             str -- The URL of this asset.
         """
 
-        if DJANGO_VITE_DEV_MODE:
-            return DjangoViteAssetLoader._generate_vite_server_url(path)
-
         if not self._manifest or path not in self._manifest:
             raise RuntimeError(
                 f"Cannot find {path} in Vite manifest "
                 f"at {DJANGO_VITE_MANIFEST_PATH}"
             )
 
-        return urljoin(DJANGO_VITE_STATIC_URL, self._manifest[path]["file"])
+        return self._resolved[path]["script_url"]
 
     def generate_vite_legacy_polyfills(
         self,
@@ -228,21 +521,58 @@ class DjangoViteAssetLoader:
             str -- The script tag to the polyfills.
         """
 
-        if DJANGO_VITE_DEV_MODE:
-            return ""
+        return self._generate_vite_legacy_polyfills_tag(
+            DjangoViteAssetLoader._generate_script_attrs_str(
+                _SCRIPT_NOMODULE_ATTRS, _SCRIPT_NOMODULE_ATTRS_STR, kwargs
+            )
+        )
 
-        scripts_attrs = {"nomodule": "", "crossorigin": "", **kwargs}
+    def _dev_generate_vite_legacy_polyfills_tag(
+        self,
+        scripts_attrs_str: str,
+    ) -> str:
+        """
+        Development implementation of '_generate_vite_legacy_polyfills_tag',
+        legacy polyfills are not used in development.
 
-        for path, content in self._manifest.items():
-            if DJANGO_VITE_LEGACY_POLYFILLS_MOTIF in path:
-                return DjangoViteAssetLoader._generate_script_tag(
-                    urljoin(DJANGO_VITE_STATIC_URL, content["file"]),
-                    attrs=scripts_attrs,
-                )
+        Arguments:
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Returns:
+            str -- An empty string.
+        """
+
+        return ""
+
+    def _prod_generate_vite_legacy_polyfills_tag(
+        self,
+        scripts_attrs_str: str,
+    ) -> str:
+        """
+        Production implementation of 'generate_vite_legacy_polyfills'.
 
-        raise RuntimeError(
-            f"Vite legacy polyfills not found in manifest "
-            f"at {DJANGO_VITE_MANIFEST_PATH}"
+        Arguments:
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Raises:
+            RuntimeError: If polyfills path not found inside
+                the 'manifest.json' (only in production).
+
+        Returns:
+            str -- The script tag to the polyfills.
+        """
+
+        if self._legacy_polyfills_path is None:
+            raise RuntimeError(
+                f"Vite legacy polyfills not found in manifest "
+                f"at {DJANGO_VITE_MANIFEST_PATH}"
+            )
+
+        return DjangoViteAssetLoader._generate_script_tag(
+            self._resolved[self._legacy_polyfills_path]["script_url"],
+            scripts_attrs_str,
         )
 
     def generate_vite_legacy_asset(
@@ -271,8 +601,53 @@ class DjangoViteAssetLoader:
             str -- The script tag of this legacy asset .
         """
 
-        if DJANGO_VITE_DEV_MODE:
-            return ""
+        return self._generate_vite_legacy_asset_tag(
+            path,
+            DjangoViteAssetLoader._generate_script_attrs_str(
+                _SCRIPT_NOMODULE_ATTRS, _SCRIPT_NOMODULE_ATTRS_STR, kwargs
+            ),
+        )
+
+    def _dev_generate_vite_legacy_asset_tag(
+        self,
+        path: str,
+        scripts_attrs_str: str,
+    ) -> str:
+        """
+        Development implementation of '_generate_vite_legacy_asset_tag',
+        legacy assets are not used in development.
+
+        Arguments:
+            path {str} -- Path to a Vite asset to include.
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Returns:
+            str -- An empty string.
+        """
+
+        return ""
+
+    def _prod_generate_vite_legacy_asset_tag(
+        self,
+        path: str,
+        scripts_attrs_str: str,
+    ) -> str:
+        """
+        Production implementation of 'generate_vite_legacy_asset'.
+
+        Arguments:
+            path {str} -- Path to a Vite asset to include.
+            scripts_attrs_str {str} -- Attributes string of the script tag
+                (see '_generate_script_attrs_str').
+
+        Raises:
+            RuntimeError: If cannot find the asset path in the
+                manifest (only in production).
+
+        Returns:
+            str -- The script tag of this legacy asset.
+        """
 
         if not self._manifest or path not in self._manifest:
             raise RuntimeError(
@@ -280,32 +655,153 @@ class DjangoViteAssetLoader:
                 f"at {DJANGO_VITE_MANIFEST_PATH}"
             )
 
-        manifest_entry = self._manifest[path]
-        scripts_attrs = {"nomodule": "", "crossorigin": "", **kwargs}
-
         return DjangoViteAssetLoader._generate_script_tag(
-            urljoin(DJANGO_VITE_STATIC_URL, manifest_entry["file"]),
-            attrs=scripts_attrs,
+            self._resolved[path]["script_url"],
+            scripts_attrs_str,
         )
 
+    def _resolve_manifest_entry(self, path: str) -> Dict[str, List[str]]:
+        """
+        Computes once everything needed to generate the tags of an asset.
+
+        Arguments:
+            path {str} -- Path to an asset in the 'manifest.json'.
+
+        Returns:
+            dict -- The URL of the asset ('script_url'), the <link> tags
+                of its CSS dependencies ('css_tags') and the preload tags
+                of its imported chunks ('import_preload_tags').
+        """
+
+        manifest_entry = self._manifest[path]
+
+        return {
+            "script_url": _generate_production_server_url(
+                manifest_entry["file"]
+            ),
+            "css_tags": self._generate_css_files_of_asset(
+                path, DjangoViteAssetLoader._generate_stylesheet_tag
+            ),
+            "import_preload_tags": [
+                DjangoViteAssetLoader._generate_preload_tag(
+                    _generate_production_server_url(
+                        self._manifest[import_path]["file"]
+                    ),
+                    _PRELOAD_ATTRS_STR,
+                )
+                for import_path in self._get_flat_imports_of_asset(path)
+            ],
+        }
+
     def _parse_manifest(self) -> None:
+        """
+        Load the Vite manifest, from the module compiled by the
+        'compile_vite_manifest' command if it is up to date,
+        otherwise from the manifest file.
+
+        Raises:
+            RuntimeError: if cannot load the file or JSON in file is malformed.
+        """
+
+        if not self._load_compiled_manifest():
+            self._read_manifest_file()
+
+        # First manifest entry matching the legacy polyfills motif.
+        self._legacy_polyfills_path = next(
+            (
+                path
+                for path in self._manifest
+                if DJANGO_VITE_LEGACY_POLYFILLS_MOTIF in path
+            ),
+            None,
+        )
+
+        # Tags generated from a previous manifest are now outdated.
+        _generate_vite_asset.cache_clear()
+        _generate_vite_asset_url.cache_clear()
+        _generate_vite_legacy_asset.cache_clear()
+
+    def _load_compiled_manifest(self) -> bool:
+        """
+        Load the manifest compiled by the 'compile_vite_manifest' command,
+        only if it was compiled from the current manifest file and
+        with the current static URL.
+
+        Returns:
+            bool -- True if the compiled manifest has been loaded.
+        """
+
+        if DJANGO_VITE_COMPILED_MANIFEST_PATH is None:
+            return False
+
+        try:
+            spec = importlib.util.spec_from_file_location(
+                "_django_vite_compiled_manifest",
+                DJANGO_VITE_COMPILED_MANIFEST_PATH,
+            )
+            compiled_manifest = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(compiled_manifest)
+
+            up_to_date = (
+                compiled_manifest.MANIFEST_PATH == DJANGO_VITE_MANIFEST_PATH
+                and compiled_manifest.MANIFEST_MTIME_NS
+                == os.stat(DJANGO_VITE_MANIFEST_PATH).st_mtime_ns
+                and compiled_manifest.STATIC_URL == DJANGO_VITE_STATIC_URL
+            )
+
+            if not up_to_date:
+                return False
+
+            # Tags are written as plain strings in the compiled module.
+            resolved = {
+                path: {
+                    "script_url": resolved_entry["script_url"],
+                    "css_tags": [
+                        SafeString(tag) for tag in resolved_entry["css_tags"]
+                    ],
+                    "import_preload_tags": [
+                        SafeString(tag)
+                        for tag in resolved_entry["import_preload_tags"]
+                    ],
+                }
+                for path, resolved_entry in compiled_manifest.RESOLVED.items()
+            }
+
+            if resolved.keys() != compiled_manifest.MANIFEST.keys():
+                return False
+        except Exception:
+            # Missing, outdated or malformed module, the manifest file
+            # is parsed instead.
+            return False
+
+        self._manifest = compiled_manifest.MANIFEST
+        self._resolved = resolved
+
+        return True
+
+    def _read_manifest_file(self) -> None:
         """
         Read and parse the Vite manifest file.
+        Tags fragments of every asset are resolved here once and for all.
 
         Raises:
             RuntimeError: if cannot load the file or JSON in file is malformed.
         """
 
         try:
-            manifest_file = open(DJANGO_VITE_MANIFEST_PATH, "r")
-            manifest_content = manifest_file.read()
-            manifest_file.close()
-            self._manifest = json.loads(manifest_content)
+            with open(DJANGO_VITE_MANIFEST_PATH, "rb") as manifest_file:
+                self._manifest = json.loads(manifest_file.read())
+            self._css_cache = {}
+            self._flat_imports_cache = {}
+            self._resolved = {
+                path: self._resolve_manifest_entry(path)
+                for path in self._manifest
+            }
         except Exception as error:
             raise RuntimeError(
                 f"Cannot read Vite manifest file at "
                 f"{DJANGO_VITE_MANIFEST_PATH} : {str(error)}"
-            )
+            ) from error
 
     @classmethod
     def instance(cls):
@@ -318,18 +814,10 @@ class DjangoViteAssetLoader:
             DjangoViteAssetLoader -- only instance of the class.
         """
 
-        if cls._instance is None:
-            cls._instance = cls.__new__(cls)
-            cls._instance._manifest = None
-
-            # Manifest is only used in production.
-            if not DJANGO_VITE_DEV_MODE:
-                cls._instance._parse_manifest()
-
-        return cls._instance
+        return _get_loader()
 
     @classmethod
-    def generate_vite_ws_client(cls) -> str:
+    def _dev_generate_vite_ws_client(cls) -> str:
         """
         Generates the script tag for the Vite WS client for HMR.
         Only used in development, in production this method returns
@@ -339,75 +827,281 @@ class DjangoViteAssetLoader:
             str -- The script tag or an empty string.
         """
 
-        if not DJANGO_VITE_DEV_MODE:
-            return ""
-
         return cls._generate_script_tag(
-            cls._generate_vite_server_url(DJANGO_VITE_WS_CLIENT_URL),
-            {"type": "module"},
+            _generate_vite_server_url(DJANGO_VITE_WS_CLIENT_URL),
+            _SCRIPT_DEV_ATTRS_STR,
         )
 
+    @classmethod
+    def _prod_generate_vite_ws_client(cls) -> str:
+        """
+        Production implementation of 'generate_vite_ws_client',
+        the HMR client is only used in development.
+
+        Returns:
+            str -- An empty string.
+        """
+
+        return ""
+
     @staticmethod
-    def _generate_script_tag(src: str, attrs: Dict[str, str]) -> str:
+    def _generate_attrs_str(attrs: Dict[str, str]) -> str:
         """
-        Generates an HTML script tag.
+        Generates the attributes string of an HTML tag.
 
         Arguments:
-            src {str} -- Source of the script.
+            attrs {Dict[str, str]} -- List of attributes for the tag.
 
-        Keyword Arguments:
-            attrs {Dict[str, str]} -- List of custom attributes
-                for the tag.
+        Returns:
+            str -- The attributes, separated by spaces.
+        """
+
+        return " ".join([f'{key}="{value}"' for key, value in attrs.items()])
+
+    @staticmethod
+    def _dev_generate_script_attrs_str(
+        default_attrs: Dict[str, str],
+        default_attrs_str: str,
+        attrs: Dict[str, str],
+    ) -> str:
+        """
+        Development implementation of '_generate_script_attrs_str',
+        custom attributes are ignored as Vite loads all by itself.
+
+        Arguments:
+            default_attrs {Dict[str, str]} -- Default attributes of the tag.
+            default_attrs_str {str} -- Precomputed attributes string of
+                the default attributes.
+            attrs {Dict[str, str]} -- Custom attributes of the tag.
 
         Returns:
-            str -- The script tag.
+            str -- The attributes string of the default attributes.
+        """
+
+        return default_attrs_str
+
+    @staticmethod
+    def _prod_generate_script_attrs_str(
+        default_attrs: Dict[str, str],
+        default_attrs_str: str,
+        attrs: Dict[str, str],
+    ) -> str:
         """
+        Generates the attributes string of a script tag, custom attributes
+        adding to or overriding the default ones.
 
-        attrs_str = " ".join(
-            [f'{key}="{value}"' for key, value in attrs.items()]
+        Arguments:
+            default_attrs {Dict[str, str]} -- Default attributes of the tag.
+            default_attrs_str {str} -- Precomputed attributes string of
+                the default attributes, used without custom attributes.
+            attrs {Dict[str, str]} -- Custom attributes of the tag.
+
+        Returns:
+            str -- The attributes, separated by spaces.
+        """
+
+        if not attrs:
+            return default_attrs_str
+
+        return DjangoViteAssetLoader._generate_attrs_str(
+            {**default_attrs, **attrs}
         )
 
-        return f'<script {attrs_str} src="{src}"></script>'
+    @staticmethod
+    def _generate_script_tag(src: str, attrs_str: str) -> SafeString:
+        """
+        Generates an HTML script tag.
+
+        Arguments:
+            src {str} -- Source of the script.
+            attrs_str {str} -- Attributes string of the tag
+                (see '_generate_attrs_str').
+
+        Returns:
+            SafeString -- The script tag.
+        """
+
+        return SafeString(f'<script {attrs_str} src="{src}"></script>')
 
     @staticmethod
-    def _generate_stylesheet_tag(href: str) -> str:
+    def _generate_preload_tag(href: str, attrs_str: str) -> SafeString:
         """
-        Generates and HTML <link> stylesheet tag for CSS.
+        Generates an HTML <link> preload tag for imported JS chunks.
 
         Arguments:
-            href {str} -- CSS file URL.
+            href {str} -- Chunk file URL.
+            attrs_str {str} -- Attributes string of the tag
+                (see '_generate_attrs_str').
 
         Returns:
-            str -- CSS link tag.
+            SafeString -- The preload link tag.
         """
 
-        return f'<link rel="stylesheet" href="{href}" />'
+        return SafeString(f'<link {attrs_str} href="{href}" />')
 
     @staticmethod
-    def _generate_vite_server_url(path: str) -> str:
+    def _join_assets_tags(
+        assets_tags: Iterable[Tuple[SafeString, List[str]]],
+    ) -> SafeString:
         """
-        Generates an URL to and asset served by the Vite development server.
+        Joins the tags of several assets, the preload tag of a chunk
+        imported by several of them being only kept the first time.
 
-        Keyword Arguments:
-            path {str} -- Path to the asset.
+        Arguments:
+            assets_tags {Iterable[Tuple[SafeString, List[str]]]} -- Tags
+                of each asset and their preload tags of imports
+                (see '_generate_vite_asset_tags').
 
         Returns:
-            str -- Full URL to the asset.
+            SafeString -- All tags of the assets.
         """
 
-        return urljoin(
-            f"{DJANGO_VITE_DEV_SERVER_PROTOCOL}://"
-            f"{DJANGO_VITE_DEV_SERVER_HOST}:{DJANGO_VITE_DEV_SERVER_PORT}",
-            urljoin(DJANGO_VITE_STATIC_URL, path),
+        tags = []
+        preloaded = set()
+
+        for asset_tags, import_preload_tags in assets_tags:
+            tags.append(asset_tags)
+
+            for import_preload_tag in import_preload_tags:
+                if import_preload_tag not in preloaded:
+                    preloaded.add(import_preload_tag)
+                    tags.append(import_preload_tag)
+
+        return SafeString("\n".join(tags))
+
+    @staticmethod
+    def _generate_stylesheet_tag(href: str) -> SafeString:
+        """
+        Generates and HTML <link> stylesheet tag for CSS.
+
+        Arguments:
+            href {str} -- CSS file URL.
+
+        Returns:
+            SafeString -- CSS link tag.
+        """
+
+        return SafeString(f'<link rel="stylesheet" href="{href}" />')
+
+    # The mode cannot change while running, so methods depending on it are
+    # bound once to their development or production implementation.
+    if DJANGO_VITE_DEV_MODE:
+        _generate_script_attrs_str = _dev_generate_script_attrs_str
+        _generate_vite_asset_tags = _dev_generate_vite_asset_tags
+        generate_vite_asset_url = _dev_generate_vite_asset_url
+        _generate_vite_legacy_polyfills_tag = (
+            _dev_generate_vite_legacy_polyfills_tag
+        )
+        _generate_vite_legacy_asset_tag = _dev_generate_vite_legacy_asset_tag
+        generate_vite_ws_client = _dev_generate_vite_ws_client
+    else:
+        _generate_script_attrs_str = _prod_generate_script_attrs_str
+        _generate_vite_asset_tags = _prod_generate_vite_asset_tags
+        generate_vite_asset_url = _prod_generate_vite_asset_url
+        _generate_vite_legacy_polyfills_tag = (
+            _prod_generate_vite_legacy_polyfills_tag
         )
+        _generate_vite_legacy_asset_tag = _prod_generate_vite_legacy_asset_tag
+        generate_vite_ws_client = _prod_generate_vite_ws_client
+
+
+def _create_loader() -> DjangoViteAssetLoader:
+    """
+    Creates an instance of 'DjangoViteAssetLoader' without any manifest.
+    Use '_get_loader' to get the instance used by template tags.
+
+    Returns:
+        DjangoViteAssetLoader -- a new instance of the class.
+    """
+
+    loader = DjangoViteAssetLoader.__new__(DjangoViteAssetLoader)
+    loader._manifest = None
+    loader._resolved = {}
+    loader._css_cache = {}
+    loader._flat_imports_cache = {}
+    loader._legacy_polyfills_path = None
+
+    return loader
+
+
+@functools.lru_cache(maxsize=None)
+def _get_loader() -> DjangoViteAssetLoader:
+    """
+    Creates the only instance of 'DjangoViteAssetLoader' on the first call,
+    then returns it from the cache.
+
+    Returns:
+        DjangoViteAssetLoader -- only instance of the class.
+    """
+
+    loader = _create_loader()
+
+    # Manifest is only used in production.
+    if not DJANGO_VITE_DEV_MODE:
+        loader._parse_manifest()
+
+    return loader
+
+
+@functools.lru_cache(maxsize=DJANGO_VITE_TAG_CACHE_SIZE)
+def _generate_vite_asset(path: str) -> Tuple[SafeString, List[str]]:
+    """
+    Cached version of 'DjangoViteAssetLoader._generate_vite_asset_tags'
+    without custom attributes.
+    Tags with custom attributes are not cached, as their values may be
+    unhashable or change on each request (e.g. CSP nonces).
+
+    Arguments:
+        path {str} -- Path to a Vite JS/TS asset to include.
+
+    Returns:
+        tuple -- The <link> tags of CSS dependencies followed by the
+            <script> tag, and the list of preload tags of imports.
+    """
+
+    return _get_loader()._generate_vite_asset_tags(
+        path, _SCRIPT_MODULE_ATTRS_STR
+    )
+
+
+@functools.lru_cache(maxsize=DJANGO_VITE_TAG_CACHE_SIZE)
+def _generate_vite_asset_url(path: str) -> str:
+    """
+    Cached version of 'DjangoViteAssetLoader.generate_vite_asset_url'.
+
+    Arguments:
+        path {str} -- Path to a Vite asset.
+
+    Returns:
+        str -- The URL of this asset.
+    """
+
+    return _get_loader().generate_vite_asset_url(path)
 
 
-# Make Loader instance at startup to prevent threading problems
-DjangoViteAssetLoader.instance()
+@functools.lru_cache(maxsize=DJANGO_VITE_TAG_CACHE_SIZE)
+def _generate_vite_legacy_asset(path: str) -> str:
+    """
+    Cached version of 'DjangoViteAssetLoader._generate_vite_legacy_asset_tag'
+    without custom attributes (see '_generate_vite_asset').
+
+    Arguments:
+        path {str} -- Path to a Vite asset to include.
+
+    Returns:
+        str -- The script tag of this legacy asset.
+    """
+
+    return _get_loader()._generate_vite_legacy_asset_tag(
+        path, _SCRIPT_NOMODULE_ATTRS_STR
+    )
+
+
+# The HMR client tag only depends on the development mode and settings.
+_VITE_WS_CLIENT_TAG = DjangoViteAssetLoader.generate_vite_ws_client()
 
 
 @register.simple_tag
-@mark_safe
 def vite_hmr_client() -> str:
     """
     Generates the script tag for the Vite WS client for HMR.
@@ -418,11 +1112,10 @@ def vite_hmr_client() -> str:
         str -- The script tag or an empty string.
     """
 
-    return DjangoViteAssetLoader.generate_vite_ws_client()
+    return _VITE_WS_CLIENT_TAG
 
 
 @register.simple_tag
-@mark_safe
 def vite_asset(
     path: str,
     **kwargs: Dict[str, str],
@@ -454,7 +1147,45 @@ def vite_asset(
 
     assert path is not None
 
-    return DjangoViteAssetLoader.instance().generate_vite_asset(path, **kwargs)
+    if kwargs:
+        return _get_loader().generate_vite_asset(path, **kwargs)
+
+    tags, import_preload_tags = _generate_vite_asset(path)
+
+    return SafeString("\n".join((tags, *import_preload_tags)))
+
+
+@register.simple_tag
+def vite_assets(
+    *paths: str,
+    **kwargs: Dict[str, str],
+) -> str:
+    """
+    Generates the tags of 'vite_asset' for several JS/TS assets,
+    chunks imported by several of them being preloaded once.
+
+    Arguments:
+        *paths {str} -- Paths to Vite JS/TS assets to include.
+
+    Keyword Arguments:
+        **kwargs {Dict[str, str]} -- Adds new attributes to generated
+            script tags.
+
+    Raises:
+        RuntimeError: If cannot find a file path in the
+            manifest (only in production).
+
+    Returns:
+        str -- The <script> tags and all <link> tags to import these
+            assets in your page.
+    """
+
+    if kwargs:
+        return _get_loader().generate_vite_assets(*paths, **kwargs)
+
+    return DjangoViteAssetLoader._join_assets_tags(
+        _generate_vite_asset(path) for path in paths
+    )
 
 
 @register.simple_tag
@@ -476,11 +1207,10 @@ def vite_asset_url(path: str) -> str:
 
     assert path is not None
 
-    return DjangoViteAssetLoader.instance().generate_vite_asset_url(path)
+    return _generate_vite_asset_url(path)
 
 
 @register.simple_tag
-@mark_safe
 def vite_legacy_polyfills(**kwargs: Dict[str, str]) -> str:
     """
     Generates a <script> tag to the polyfills generated
@@ -500,13 +1230,10 @@ def vite_legacy_polyfills(**kwargs: Dict[str, str]) -> str:
         str -- The script tag to the polyfills.
     """
 
-    return DjangoViteAssetLoader.instance().generate_vite_legacy_polyfills(
-        **kwargs
-    )
+    return _get_loader().generate_vite_legacy_polyfills(**kwargs)
 
 
 @register.simple_tag
-@mark_safe
 def vite_legacy_asset(
     path: str,
     **kwargs: Dict[str, str],
@@ -534,6 +1261,7 @@ def vite_legacy_asset(
 
     assert path is not None
 
-    return DjangoViteAssetLoader.instance().generate_vite_legacy_asset(
-        path, **kwargs
-    )
+    if kwargs:
+        return _get_loader().generate_vite_legacy_asset(path, **kwargs)
+
+    return _generate_vite_legacy_asset(path)
@@ -0,0 +1,132 @@
+import importlib
+import json
+import os
+import tempfile
+
+import django
+import pytest
+from django.conf import settings
+from django.test import override_settings
+
+# Module level settings of 'django_vite' are read on import, so Django is
+# configured before any test module is collected.
+_TMP_DIR = tempfile.mkdtemp(prefix="django_vite_tests_")
+
+MANIFEST_PATH = os.path.join(_TMP_DIR, "manifest.json")
+COMPILED_MANIFEST_PATH = os.path.join(_TMP_DIR, "compiled_manifest.py")
+
+MANIFEST = {
+    "main.js": {
+        "file": "assets/main.js",
+        "src": "main.js",
+        "isEntry": True,
+        "imports": ["_shared.js", "_vendor.js"],
+        "css": ["assets/main.css"],
+    },
+    "other.js": {
+        "file": "assets/other.js",
+        "src": "other.js",
+        "isEntry": True,
+        "imports": ["_shared.js"],
+        "css": ["assets/other.css"],
+    },
+    "_shared.js": {
+        "file": "assets/shared.js",
+        "imports": ["_vendor.js"],
+        "css": ["assets/shared.css"],
+    },
+    "_vendor.js": {"file": "assets/vendor.js"},
+    "main-legacy.js": {"file": "assets/main-legacy.js"},
+    "vite/legacy-polyfills": {"file": "assets/polyfills-legacy.js"},
+}
+
+TEMPLATES = {
+    "base.html": (
+        "{% load django_vite %}"
+        "{% vite_asset 'main.js' %}\n"
+        "{% block body %}{% endblock %}"
+    ),
+    "page.html": (
+        "{% extends 'base.html' %}"
+        "{% block body %}"
+        "{% include 'other.html' %}\n"
+        "{% include 'other.html' only %}"
+        "{% endblock %}"
+    ),
+    "other.html": "{% load django_vite %}{% vite_asset 'other.js' %}",
+}
+
+
+def _write_manifest(manifest):
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+
+_write_manifest(MANIFEST)
+
+settings.configure(
+    INSTALLED_APPS=["django_vite"],
+    STATIC_URL="/static/",
+    STATIC_ROOT=_TMP_DIR,
+    DJANGO_VITE_ASSETS_PATH=_TMP_DIR,
+    DJANGO_VITE_MANIFEST_PATH=MANIFEST_PATH,
+    DJANGO_VITE_COMPILED_MANIFEST_PATH=COMPILED_MANIFEST_PATH,
+    TEMPLATES=[
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    ("django.template.loaders.locmem.Loader", TEMPLATES),
+                ],
+            },
+        },
+    ],
+)
+django.setup()
+
+
+@pytest.fixture
+def loader():
+    """
+    Asset loader, parsing back the default manifest after the test.
+    """
+
+    from django_vite.templatetags.django_vite import _get_loader
+
+    yield _get_loader()
+
+    if os.path.exists(COMPILED_MANIFEST_PATH):
+        os.remove(COMPILED_MANIFEST_PATH)
+    _write_manifest(MANIFEST)
+    _get_loader()._parse_manifest()
+
+
+@pytest.fixture
+def parse_manifest(loader):
+    """
+    Writes the given manifest and parses it with the asset loader.
+    """
+
+    def parse(manifest):
+        _write_manifest(manifest)
+        loader._parse_manifest()
+
+    return parse
+
+
+@pytest.fixture
+def reload_django_vite():
+    """
+    Reloads the template tags module with overridden settings, as they are
+    read on import, then reloads it with the test settings after the test.
+    """
+
+    from django_vite.templatetags import django_vite
+
+    def reload(**overridden_settings):
+        with override_settings(**overridden_settings):
+            return importlib.reload(django_vite)
+
+    yield reload
+
+    importlib.reload(django_vite)
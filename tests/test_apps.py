@@ -0,0 +1,25 @@
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.template import Context, Engine
+
+ENGINE_LIBRARIES = {"django_vite": "django_vite.templatetags.django_vite"}
+
+
+def test_missing_manifest_raised_on_first_use(reload_django_vite, tmp_path):
+    reload_django_vite(
+        DJANGO_VITE_MANIFEST_PATH=str(tmp_path / "manifest.json")
+    )
+
+    with pytest.warns(RuntimeWarning, match="Cannot read Vite manifest"):
+        apps.get_app_config("django_vite").ready()
+
+    call_command("check")
+    engine = Engine(libraries=ENGINE_LIBRARIES)
+    template = engine.from_string("{% load django_vite %}no asset")
+    assert template.render(Context()) == "no asset"
+
+    with pytest.raises(RuntimeError, match="Cannot read Vite manifest"):
+        engine.from_string(
+            "{% load django_vite %}{% vite_asset 'main.js' %}"
+        ).render(Context())
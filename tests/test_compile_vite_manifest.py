@@ -0,0 +1,120 @@
+import importlib.util
+import io
+import json
+import os
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeString
+
+from django_vite.templatetags import django_vite
+
+
+def render_all(loader):
+    return (
+        render_to_string("page.html"),
+        loader.generate_vite_asset("other.js", nonce="abc"),
+        loader.generate_vite_asset_url("main.js"),
+        loader.generate_vite_legacy_polyfills(),
+        loader.generate_vite_legacy_asset("main-legacy.js"),
+    )
+
+
+def append_to_module(module_path, code):
+    with open(module_path, "a", encoding="utf-8") as module_file:
+        module_file.write(code)
+    bytecode_path = importlib.util.cache_from_source(module_path)
+    if os.path.exists(bytecode_path):
+        os.remove(bytecode_path)
+
+
+@pytest.fixture
+def compiled_manifest(loader):
+    call_command("compile_vite_manifest", stdout=io.StringIO())
+    assert loader._load_compiled_manifest()
+    return django_vite.DJANGO_VITE_COMPILED_MANIFEST_PATH
+
+
+def test_compile_leaves_loaded_manifest_untouched(loader):
+    resolved = loader._resolved
+
+    call_command("compile_vite_manifest", stdout=io.StringIO())
+
+    assert loader._resolved is resolved
+
+
+def test_compile_missing_manifest(reload_django_vite, tmp_path):
+    reload_django_vite(
+        DJANGO_VITE_MANIFEST_PATH=str(tmp_path / "manifest.json")
+    )
+
+    with pytest.raises(CommandError, match="Cannot read Vite manifest"):
+        call_command("compile_vite_manifest")
+
+
+def test_compiled_manifest_path_not_set(reload_django_vite):
+    module = reload_django_vite(DJANGO_VITE_COMPILED_MANIFEST_PATH=None)
+
+    with pytest.raises(CommandError, match="COMPILED_MANIFEST_PATH"):
+        call_command("compile_vite_manifest")
+    assert not module._get_loader()._load_compiled_manifest()
+
+
+def test_compiled_manifest_same_output_as_json(
+    loader, compiled_manifest, monkeypatch
+):
+    expected = render_all(loader)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The JSON manifest must not be parsed.")
+
+    monkeypatch.setattr(django_vite.json, "loads", fail)
+    loader._parse_manifest()
+
+    assert render_all(loader) == expected
+    assert all(
+        isinstance(tag, SafeString)
+        for resolved_entry in loader._resolved.values()
+        for tag in resolved_entry["css_tags"]
+        + resolved_entry["import_preload_tags"]
+    )
+
+
+def test_compiled_manifest_ignored_after_manifest_change(
+    loader, compiled_manifest
+):
+    manifest_path = django_vite.DJANGO_VITE_MANIFEST_PATH
+    with open(manifest_path, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    manifest["main.js"]["file"] = "assets/main.new.js"
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+    # Make sure the mtime changes on file systems with a coarse resolution.
+    mtime_ns = os.stat(manifest_path).st_mtime_ns + 1_000_000_000
+    os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+
+    assert not loader._load_compiled_manifest()
+    loader._parse_manifest()
+
+    assert loader.generate_vite_asset_url("main.js") == (
+        "/static/assets/main.new.js"
+    )
+
+
+def test_compiled_manifest_ignored_after_static_url_change(
+    loader, compiled_manifest
+):
+    append_to_module(compiled_manifest, 'STATIC_URL = "/other/"\n')
+
+    assert not loader._load_compiled_manifest()
+
+
+def test_malformed_compiled_manifest_ignored(loader, compiled_manifest):
+    expected = render_all(loader)
+    append_to_module(compiled_manifest, 'RESOLVED = {"main.js": None}\n')
+
+    assert not loader._load_compiled_manifest()
+    loader._parse_manifest()
+
+    assert render_all(loader) == expected
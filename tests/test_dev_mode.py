@@ -0,0 +1,66 @@
+import pytest
+from django.template import Context, Engine
+
+ENGINE_LIBRARIES = {"django_vite": "django_vite.templatetags.django_vite"}
+DEV_SERVER_URL = "http://localhost:3000/static/"
+
+
+@pytest.fixture
+def render(reload_django_vite):
+    reload_django_vite(DJANGO_VITE_DEV_MODE=True)
+    engine = Engine(libraries=ENGINE_LIBRARIES)
+
+    def render(template_string):
+        return engine.from_string(
+            "{% load django_vite %}" + template_string
+        ).render(Context())
+
+    return render
+
+
+def test_vite_hmr_client(render):
+    assert render("{% vite_hmr_client %}") == (
+        f'<script type="module" src="{DEV_SERVER_URL}@vite/client"></script>'
+    )
+
+
+def test_vite_asset(render):
+    assert render("{% vite_asset 'main.js' %}") == (
+        f'<script type="module" src="{DEV_SERVER_URL}main.js"></script>'
+    )
+
+
+def test_vite_asset_custom_attributes_ignored(render):
+    assert render("{% vite_asset 'main.js' foo='bar' %}") == render(
+        "{% vite_asset 'main.js' %}"
+    )
+
+
+def test_vite_assets(render):
+    assert render("{% vite_assets 'main.js' 'other.js' foo='bar' %}") == (
+        f'<script type="module" src="{DEV_SERVER_URL}main.js"></script>\n'
+        f'<script type="module" src="{DEV_SERVER_URL}other.js"></script>'
+    )
+
+
+def test_vite_asset_url(render):
+    assert render("{% vite_asset_url 'main.js' %}") == (
+        f"{DEV_SERVER_URL}main.js"
+    )
+
+
+def test_vite_asset_not_in_manifest(render):
+    assert render("{% vite_asset 'missing.js' %}") == (
+        f'<script type="module" src="{DEV_SERVER_URL}missing.js"></script>'
+    )
+
+
+def test_vite_legacy_tags(render):
+    assert (
+        render(
+            "{% vite_legacy_polyfills nonce='abc' %}"
+            "{% vite_legacy_asset 'main-legacy.js' %}"
+            "{% vite_legacy_asset 'main-legacy.js' nonce='abc' %}"
+        )
+        == ""
+    )
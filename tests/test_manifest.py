@@ -0,0 +1,60 @@
+import re
+
+import pytest
+
+CIRCULAR_MANIFEST = {
+    "main.js": {
+        "file": "assets/main.js",
+        "isEntry": True,
+        "imports": ["_a.js"],
+        "css": ["assets/main.css"],
+    },
+    "_a.js": {
+        "file": "assets/a.js",
+        "imports": ["_b.js"],
+        "css": ["assets/a.css"],
+    },
+    "other.js": {
+        "file": "assets/other.js",
+        "isEntry": True,
+        "imports": ["_b.js"],
+    },
+    "_b.js": {
+        "file": "assets/b.js",
+        "imports": ["_a.js", "_b.js"],
+        "css": ["assets/b.css"],
+    },
+}
+
+
+@pytest.fixture
+def circular_loader(loader, parse_manifest):
+    parse_manifest(CIRCULAR_MANIFEST)
+    return loader
+
+
+@pytest.mark.parametrize("path", ["main.js", "other.js"])
+def test_circular_imports_preloaded_once(circular_loader, path):
+    output = circular_loader.generate_vite_asset(path)
+
+    assert sorted(re.findall(r'modulepreload.*href="([^"]+)"', output)) == [
+        "/static/assets/a.js",
+        "/static/assets/b.js",
+    ]
+
+
+@pytest.mark.parametrize("path", ["main.js", "other.js", "_a.js", "_b.js"])
+def test_circular_imports_css_included_once(circular_loader, path):
+    output = circular_loader.generate_vite_asset(path).split("\n")
+    stylesheets = [line for line in output if "stylesheet" in line]
+
+    assert len(stylesheets) == len(set(stylesheets))
+    for css in ("a.css", "b.css"):
+        assert f'<link rel="stylesheet" href="/static/assets/{css}" />' in (
+            stylesheets
+        )
+
+
+def test_unknown_asset(loader):
+    with pytest.raises(RuntimeError):
+        loader.generate_vite_asset("missing.js")
@@ -0,0 +1,89 @@
+from django.template import Context, Template
+
+from django_vite.templatetags.django_vite import vite_asset
+
+STYLESHEET = '<link rel="stylesheet" href="/static/assets/{}" />'
+MODULE_SCRIPT = (
+    '<script type="module" crossorigin="" src="/static/assets/{}"></script>'
+)
+MODULE_PRELOAD = (
+    '<link type="text/javascript" crossorigin="anonymous" '
+    'rel="modulepreload" as="script" href="/static/assets/{}" />'
+)
+
+
+def render(template_string, **context):
+    return Template("{% load django_vite %}" + template_string).render(
+        Context(context)
+    )
+
+
+def test_vite_asset(loader):
+    assert render("{% vite_asset 'main.js' %}").split("\n") == [
+        STYLESHEET.format("shared.css"),
+        STYLESHEET.format("main.css"),
+        MODULE_SCRIPT.format("main.js"),
+        MODULE_PRELOAD.format("vendor.js"),
+        MODULE_PRELOAD.format("shared.js"),
+    ]
+
+
+def test_vite_asset_custom_attributes(loader):
+    assert render(
+        "{% vite_asset 'other.js' crossorigin='anonymous' nonce=nonce %}",
+        nonce="abc",
+    ).split("\n")[2] == (
+        '<script type="module" crossorigin="anonymous" nonce="abc" '
+        'src="/static/assets/other.js"></script>'
+    )
+
+
+def test_vite_asset_url(loader):
+    assert render("{% vite_asset_url 'main.js' %}") == "/static/assets/main.js"
+
+
+def test_vite_legacy_asset(loader):
+    assert render(
+        "{% vite_legacy_polyfills %}{% vite_legacy_asset 'main-legacy.js' %}"
+    ) == (
+        '<script nomodule="" crossorigin="" '
+        'src="/static/assets/polyfills-legacy.js"></script>'
+        '<script nomodule="" crossorigin="" '
+        'src="/static/assets/main-legacy.js"></script>'
+    )
+
+
+def test_vite_asset_callable_from_python(loader):
+    assert vite_asset("main.js") == render("{% vite_asset 'main.js' %}")
+
+
+def test_vite_assets(loader):
+    assert render("{% vite_assets 'main.js' 'other.js' %}").split("\n") == [
+        STYLESHEET.format("shared.css"),
+        STYLESHEET.format("main.css"),
+        MODULE_SCRIPT.format("main.js"),
+        MODULE_PRELOAD.format("vendor.js"),
+        MODULE_PRELOAD.format("shared.js"),
+        STYLESHEET.format("shared.css"),
+        STYLESHEET.format("other.css"),
+        MODULE_SCRIPT.format("other.js"),
+    ]
+
+
+def test_vite_assets_custom_attributes(loader):
+    output = render(
+        "{% vite_assets 'main.js' 'other.js' nonce=nonce %}", nonce="abc"
+    )
+
+    assert output.count('nonce="abc"') == 2
+    assert output.count("modulepreload") == 2
+
+
+def test_vite_asset_preloads_not_deduplicated_across_tags(loader):
+    output = render("{% vite_asset 'main.js' %}\n{% vite_asset 'other.js' %}")
+
+    assert output.count(MODULE_PRELOAD.format("shared.js")) == 2
+
+
+def test_vite_hmr_client(loader):
+    assert render("{% vite_hmr_client %}") == ""